@@ -0,0 +1,81 @@
+# PhonePe Transaction Dashboard - Offline GeoJSON Simplifier
+# Shrinks Indian_States.geojson for the choropleths: Douglas-Peucker
+# simplification, coordinate rounding to 3 decimals (~100m), and dropping
+# every property except NAME_1. The dashboard zoom level cannot resolve the
+# detail being removed, but the browser pays for every vertex it receives.
+#
+# Usage: python simplify_geojson.py
+
+import json
+
+INPUT_FILE = "Indian_States.geojson"
+OUTPUT_FILE = "Indian_States.min.geojson"
+PRECISION = 3          # decimal places kept per coordinate (~100m at the equator)
+TOLERANCE = 0.002      # Douglas-Peucker tolerance in degrees (~200m)
+
+def _point_segment_distance(p, a, b):
+    """Perpendicular distance from point p to segment a-b (planar approximation)."""
+    ax, ay = a
+    bx, by = b
+    px, py = p
+    dx, dy = bx - ax, by - ay
+    if dx == 0 and dy == 0:
+        return ((px - ax) ** 2 + (py - ay) ** 2) ** 0.5
+    t = ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)
+    t = max(0.0, min(1.0, t))
+    cx, cy = ax + t * dx, ay + t * dy
+    return ((px - cx) ** 2 + (py - cy) ** 2) ** 0.5
+
+def douglas_peucker(points, tolerance):
+    """Iterative Douglas-Peucker simplification of a coordinate ring."""
+    if len(points) < 3:
+        return points
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        max_dist, max_idx = 0.0, start
+        for i in range(start + 1, end):
+            d = _point_segment_distance(points[i], points[start], points[end])
+            if d > max_dist:
+                max_dist, max_idx = d, i
+        if max_dist > tolerance:
+            keep[max_idx] = True
+            stack.append((start, max_idx))
+            stack.append((max_idx, end))
+    return [p for p, k in zip(points, keep) if k]
+
+def simplify_ring(ring):
+    """Simplify, round, and de-duplicate one coordinate ring."""
+    simplified = douglas_peucker([(x, y) for x, y in ring], TOLERANCE)
+    rounded = [(round(x, PRECISION), round(y, PRECISION)) for x, y in simplified]
+    deduped = [p for i, p in enumerate(rounded) if i == 0 or p != rounded[i - 1]]
+    if deduped[0] != deduped[-1]:       # rings must stay closed
+        deduped.append(deduped[0])
+    return [list(p) for p in deduped] if len(deduped) >= 4 else [list(p) for p in rounded]
+
+def simplify_geometry(geometry):
+    """Simplify a Polygon or MultiPolygon geometry in place."""
+    if geometry["type"] == "Polygon":
+        geometry["coordinates"] = [simplify_ring(r) for r in geometry["coordinates"]]
+    elif geometry["type"] == "MultiPolygon":
+        geometry["coordinates"] = [[simplify_ring(r) for r in poly] for poly in geometry["coordinates"]]
+    return geometry
+
+def main():
+    with open(INPUT_FILE, "r") as f:
+        geojson_data = json.load(f)
+
+    for feature in geojson_data["features"]:
+        feature["geometry"] = simplify_geometry(feature["geometry"])
+        # Keep only the state name; the dashboard derives everything else
+        feature["properties"] = {"NAME_1": feature.get("properties", {}).get("NAME_1", "")}
+        feature.pop("id", None)
+
+    with open(OUTPUT_FILE, "w") as f:
+        json.dump(geojson_data, f, separators=(",", ":"))
+    print(f"✅ Wrote {OUTPUT_FILE}")
+
+if __name__ == "__main__":
+    main()